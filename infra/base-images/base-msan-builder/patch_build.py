@@ -25,6 +25,7 @@ import sys
 
 INSTRUMENTED_LIBRARIES_DIRNAME = 'instrumented_libraries'
 MSAN_LIBS_PATH = os.getenv('MSAN_LIBS_PATH', '/msan')
+LDD_OUTPUT_PATTERN = re.compile(r'\s*([^\s]+)\s*=>\s*([^\s]+)')
 
 
 def IsElf(file_path):
@@ -43,9 +44,8 @@ def Ldd(binary_path):
 
   libs = []
 
-  OUTPUT_PATTERN = re.compile(r'\s*([^\s]+)\s*=>\s*([^\s]+)')
   for line in output.splitlines():
-    match = OUTPUT_PATTERN.match(line)
+    match = LDD_OUTPUT_PATTERN.match(line)
     if not match:
       continue
 
@@ -25,6 +25,8 @@ FUZZING_BUILD_TAG = 'fuzzing'
 
 GCB_LOGS_BUCKET = 'oss-fuzz-gcb-logs'
 
+WORKDIR_REGEX = re.compile(r'\s*WORKDIR\s*([^\s]+)')
+
 CONFIGURATIONS = {
     'sanitizer-address': ['SANITIZER=address'],
     'sanitizer-dataflow': ['SANITIZER=dataflow'],
@@ -143,13 +145,11 @@ def get_sanitizers(project_yaml):
 
 def workdir_from_dockerfile(dockerfile):
   """Parse WORKDIR from the Dockerfile."""
-  WORKDIR_REGEX = re.compile(r'\s*WORKDIR\s*([^\s]+)')
-
   with open(dockerfile) as f:
     lines = f.readlines()
 
   for line in lines:
-    match = re.match(WORKDIR_REGEX, line)
+    match = WORKDIR_REGEX.match(line)
     if match:
       # We need to escape '$' since they're used for subsitutions in Container
       # Builer builds.
@@ -43,6 +43,7 @@ BASE_IMAGES = [
 ]
 
 VALID_PROJECT_NAME_REGEX = re.compile(r'^[a-zA-Z0-9_-]+$')
+WORKDIR_REGEX = re.compile(r'\s*WORKDIR\s*([^\s]+)')
 MAX_PROJECT_NAME_LENGTH = 26
 
 if sys.version_info[0] >= 3:
@@ -320,14 +321,13 @@ def _env_to_docker_args(env_list):
 
 def _workdir_from_dockerfile(project_name):
   """Parse WORKDIR from the Dockerfile for the given project."""
-  WORKDIR_REGEX = re.compile(r'\s*WORKDIR\s*([^\s]+)')
   dockerfile_path = _get_dockerfile_path(project_name)
 
   with open(dockerfile_path) as f:
     lines = f.readlines()
 
   for line in reversed(lines):  # reversed to get last WORKDIR.
-    match = re.match(WORKDIR_REGEX, line)
+    match = WORKDIR_REGEX.match(line)
     if match:
       workdir = match.group(1)
       workdir = workdir.replace('$SRC', '/src')